@@ -60,6 +60,9 @@ def arange(
     .. note::
        This function cannot guarantee that the interval does not include the ``stop`` value in those cases where ``step`` is not an integer and floating-point rounding errors affect the length of the output array.
 
+    .. note::
+       If ``start``, ``step``, and (if provided) ``stop`` are integers and the output array has an integer data type, both the length of the output array and its elements must be computed exactly using integer arithmetic, without intermediate conversion to a floating-point data type. That is, the element at index ``i`` must equal ``s + i*step``, where ``s`` is ``start`` if ``stop`` is provided and ``0`` if ``stop`` is ``None`` (in which case ``start`` is the end of the interval).
+
     Returns
     -------
     out: array
@@ -90,6 +93,9 @@ def asarray(
 
            An object supporting the buffer protocol can be turned into a memoryview through ``memoryview(obj)``.
 
+        .. note::
+           A nested sequence should be rectangular (i.e., all sequences at the same level of nesting should have the same length, and all Python scalars should be at the same depth). For nested sequences which are not rectangular (i.e., "ragged" sequences), behavior is unspecified and thus implementation-defined.
+
     dtype: Optional[dtype]
         output array data type. If ``dtype`` is ``None``, the output array data type must be inferred from the data type(s) in ``obj``. If all input values are Python scalars, then, in order of precedence,
 
@@ -138,7 +144,7 @@ def empty(
     Parameters
     ----------
     shape: Union[int, Tuple[int, ...]]
-        output array shape.
+        output array shape. If ``shape`` is an ``int``, the function must behave as if ``shape`` were the one-element tuple ``(shape,)``.
     dtype: Optional[dtype]
         output array data type. If ``dtype`` is ``None``, the output array data type must be the default real-valued floating-point data type. Default: ``None``.
     device: Optional[device]
@@ -148,6 +154,9 @@ def empty(
     -------
     out: array
         an array containing uninitialized data.
+
+        .. note::
+           The values of an uninitialized array are unspecified. For example, a conforming implementation may reuse memory previously held by arrays which are no longer referenced, and such memory may or may not contain zeros. Accordingly, array consumers must not rely on the value of any element of the returned array prior to assigning to it.
     """
 
 
@@ -170,6 +179,9 @@ def empty_like(
     -------
     out: array
         an array having the same shape as ``x`` and containing uninitialized data.
+
+        .. note::
+           The values of an uninitialized array are unspecified. For example, a conforming implementation may reuse memory previously held by arrays which are no longer referenced, and such memory may or may not contain zeros. Accordingly, array consumers must not rely on the value of any element of the returned array prior to assigning to it.
     """
 
 
@@ -196,6 +208,10 @@ def eye(
         number of columns in the output array. If ``None``, the default number of columns in the output array is equal to ``n_rows``. Default: ``None``.
     k: int
         index of the diagonal. A positive value refers to an upper diagonal, a negative value to a lower diagonal, and ``0`` to the main diagonal. Default: ``0``.
+
+        .. note::
+           If ``k >= n_cols`` or ``k <= -n_rows``, the ``k``\th diagonal contains no elements, and all elements of the returned array must be equal to zero.
+
     dtype: Optional[dtype]
         output array data type. If ``dtype`` is ``None``, the output array data type must be the default real-valued floating-point data type. Default: ``None``.
     device: Optional[device]
@@ -271,6 +287,8 @@ def from_dlpack(
     See :meth:`array.__dlpack__` for implementation suggestions for `from_dlpack` in
     order to handle DLPack versioning correctly.
 
+    If ``x`` is an array object of the conforming implementation itself, ``copy`` is not ``True``, and either ``device`` is ``None`` or ``device`` equals ``x.device``, the implementation may return a view of ``x`` without exporting and importing a DLPack capsule.
+
     A way to move data from two array libraries to the same device (assumed supported by both libraries) in
     a library-agnostic fashion is illustrated below:
 
@@ -310,7 +328,7 @@ def full(
     Parameters
     ----------
     shape: Union[int, Tuple[int, ...]]
-        output array shape.
+        output array shape. If ``shape`` is an ``int``, the function must behave as if ``shape`` were the one-element tuple ``(shape,)``.
     fill_value: Union[bool, int, float, complex]
         fill value.
     dtype: Optional[dtype]
@@ -324,6 +342,9 @@ def full(
         .. note::
            If the ``fill_value`` exceeds the precision of the resolved default output array data type, behavior is left unspecified and, thus, implementation-defined.
 
+        .. note::
+           If ``dtype`` is not ``None`` and the ``fill_value`` has a data type which is not of the same data type kind (boolean, integer, or floating-point) as ``dtype`` (see :ref:`type-promotion`), behavior is unspecified and, thus, implementation-defined.
+
     device: Optional[device]
         device on which to place the created array. Default: ``None``.
 
@@ -449,6 +470,12 @@ def linspace(
     .. note::
        As mixed data type promotion is implementation-defined, behavior when ``start`` or ``stop`` exceeds the maximum safe integer of an output floating-point data type is implementation-defined. An implementation may choose to overflow or raise an exception.
 
+    .. note::
+       The element at index ``i`` should be computed directly from ``start``, ``stop``, and ``i`` (e.g., as :math:`\textrm{start} + i \Delta_{\textrm{real}}` for real-valued output arrays or :math:`\textrm{start} + i \Delta_{\textrm{complex}}` for complex output arrays), rather than by repeatedly adding the spacing to the preceding element, such that rounding errors do not accumulate along the output array.
+
+    .. note::
+       If ``num`` is greater than ``0``, the first element of the output array should equal ``start``. If ``endpoint`` is ``True`` and ``num`` is greater than ``1``, the last element of the output array should equal ``stop``, even in cases where floating-point rounding errors would otherwise cause the computed value of the last element to differ from ``stop``.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
     """
@@ -479,6 +506,9 @@ def meshgrid(*arrays: array, indexing: str = "xy") -> List[array]:
 
         Each returned array should have the same data type as the input arrays.
 
+        .. note::
+           As the values of each returned array only vary along a single axis, a conforming implementation may return arrays which are views on the input arrays (e.g., by broadcasting each input array to the output shape), such that multiple elements of a returned array refer to the same memory location. Accordingly, mutating a returned array is not portable (see :ref:`copyview-mutability`).
+
     Notes
     -----
 
@@ -502,7 +532,7 @@ def ones(
     Parameters
     ----------
     shape: Union[int, Tuple[int, ...]]
-        output array shape.
+        output array shape. If ``shape`` is an ``int``, the function must behave as if ``shape`` were the one-element tuple ``(shape,)``.
     dtype: Optional[dtype]
         output array data type. If ``dtype`` is ``None``, the output array data type must be the default real-valued floating-point data type. Default: ``None``.
     device: Optional[device]
@@ -569,10 +599,13 @@ def tril(x: array, /, *, k: int = 0) -> array:
         .. note::
            The main diagonal is defined as the set of indices ``{(i, i)}`` for ``i`` on the interval ``[0, min(M, N) - 1]``.
 
+        .. note::
+           If ``k >= N - 1``, no elements lie above the specified diagonal and the returned array must contain the same values as ``x``. If ``k <= -M``, every element lies above the specified diagonal and all elements of the returned array must be zeroed.
+
     Returns
     -------
     out: array
-        an array containing the lower triangular part(s). The returned array must have the same shape and data type as ``x``. All elements above the specified diagonal ``k`` must be zeroed. The returned array should be allocated on the same device as ``x``.
+        an array containing the lower triangular part(s). The returned array must have the same shape and data type as ``x``. All elements above the specified diagonal ``k`` must be zeroed. Zeroed elements must be zero regardless of their values in ``x`` (e.g., ``NaN`` and infinite values must be zeroed as well) and, for floating-point data types, must be positive zeros (i.e., ``+0`` and, for complex floating-point data types, ``+0 + 0j``). The returned array should be allocated on the same device as ``x``.
     """
 
 
@@ -593,10 +626,13 @@ def triu(x: array, /, *, k: int = 0) -> array:
         .. note::
            The main diagonal is defined as the set of indices ``{(i, i)}`` for ``i`` on the interval ``[0, min(M, N) - 1]``.
 
+        .. note::
+           If ``k <= 1 - M``, no elements lie below the specified diagonal and the returned array must contain the same values as ``x``. If ``k >= N``, every element lies below the specified diagonal and all elements of the returned array must be zeroed.
+
     Returns
     -------
     out: array
-        an array containing the upper triangular part(s). The returned array must have the same shape and data type as ``x``. All elements below the specified diagonal ``k`` must be zeroed. The returned array should be allocated on the same device as ``x``.
+        an array containing the upper triangular part(s). The returned array must have the same shape and data type as ``x``. All elements below the specified diagonal ``k`` must be zeroed. Zeroed elements must be zero regardless of their values in ``x`` (e.g., ``NaN`` and infinite values must be zeroed as well) and, for floating-point data types, must be positive zeros (i.e., ``+0`` and, for complex floating-point data types, ``+0 + 0j``). The returned array should be allocated on the same device as ``x``.
     """
 
 
@@ -609,10 +645,13 @@ def zeros(
     """
     Returns a new array having a specified ``shape`` and filled with zeros.
 
+    .. note::
+       An output array having a floating-point data type must contain positive zeros (i.e., ``+0``). An output array having a complex floating-point data type must contain complex numbers whose real and imaginary components are both equal to positive zero (i.e., ``+0 + 0j``).
+
     Parameters
     ----------
     shape: Union[int, Tuple[int, ...]]
-        output array shape.
+        output array shape. If ``shape`` is an ``int``, the function must behave as if ``shape`` were the one-element tuple ``(shape,)``.
     dtype: Optional[dtype]
         output array data type. If ``dtype`` is ``None``, the output array data type must be the default real-valued floating-point data type. Default: ``None``.
     device: Optional[device]
@@ -631,6 +670,9 @@ def zeros_like(
     """
     Returns a new array filled with zeros and having the same ``shape`` as an input array ``x``.
 
+    .. note::
+       An output array having a floating-point data type must contain positive zeros (i.e., ``+0``). An output array having a complex floating-point data type must contain complex numbers whose real and imaginary components are both equal to positive zero (i.e., ``+0 + 0j``).
+
     Parameters
     ----------
     x: array
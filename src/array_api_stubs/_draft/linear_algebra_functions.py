@@ -38,6 +38,8 @@ def matmul(x1: array, x2: array, /) -> array:
     Notes
     -----
 
+    For stacked matrices, each matrix product depends only on the corresponding pair of stacked input matrices. Accordingly, computing ``matmul`` over stacked inputs is equivalent to computing ``matmul`` for each pair of corresponding matrices and stacking the results, and a sequence of independent matrix products having the same shapes may equivalently be computed as a single stacked matrix product (subject to the considerations described in :ref:`accuracy`).
+
     .. versionchanged:: 2022.12
        Added complex data type support.
 
@@ -59,12 +61,15 @@ def matrix_transpose(x: array, /) -> array:
     Parameters
     ----------
     x: array
-        input array having shape ``(..., M, N)`` and whose innermost two dimensions form ``MxN`` matrices.
+        input array having shape ``(..., M, N)`` and whose innermost two dimensions form ``MxN`` matrices. If ``x`` has fewer than two dimensions, an error should be raised (see :attr:`array.mT`).
 
     Returns
     -------
     out: array
         an array containing the transpose for each matrix and having shape ``(..., N, M)``. The returned array must have the same data type as ``x``.
+
+        .. note::
+           As transposition only changes the order in which elements are traversed, a conforming implementation may return a view on ``x`` (e.g., by exchanging the strides of the last two dimensions) rather than a copy. Accordingly, mutating the returned array is not portable (see :ref:`copyview-mutability`).
     """
 
 
@@ -94,7 +99,7 @@ def tensordot(
     axes: Union[int, Tuple[Sequence[int], Sequence[int]]]
         number of axes (dimensions) to contract or explicit sequences of axis (dimension) indices for ``x1`` and ``x2``, respectively.
 
-        If ``axes`` is an ``int`` equal to ``N``, then contraction must be performed over the last ``N`` axes of ``x1`` and the first ``N`` axes of ``x2`` in order. The size of each corresponding axis (dimension) must match. Must be nonnegative.
+        If ``axes`` is an ``int`` equal to ``N``, then contraction must be performed over the last ``N`` axes of ``x1`` and the first ``N`` axes of ``x2`` in order. The size of each corresponding axis (dimension) must match. Must be nonnegative and must not exceed the rank of either ``x1`` or ``x2`` (i.e., ``N`` must reside on the closed interval ``[0, min(x1.ndim, x2.ndim)]``).
 
         -   If ``N`` equals ``0``, the result is the tensor (outer) product.
         -   If ``N`` equals ``1``, the result is the tensor dot product.
@@ -109,11 +114,13 @@ def tensordot(
     Returns
     -------
     out: array
-        an array containing the tensor contraction whose shape consists of the non-contracted axes (dimensions) of the first array ``x1``, followed by the non-contracted axes (dimensions) of the second array ``x2``. The returned array must have a data type determined by :ref:`type-promotion`.
+        an array containing the tensor contraction whose shape consists of the non-contracted axes (dimensions) of the first array ``x1``, followed by the non-contracted axes (dimensions) of the second array ``x2``. The returned array must have a data type determined by :ref:`type-promotion`. If any contracted axis (dimension) has size ``0``, every element of the returned array must equal zero (i.e., the value of an empty sum).
 
     Notes
     -----
 
+    A tensor contraction can be expressed as a single matrix product. Let ``K`` be the product of the sizes of the contracted axes, and let ``P`` and ``Q`` be the products of the sizes of the non-contracted axes of ``x1`` and ``x2``, respectively. The result of ``tensordot`` equals the result of permuting the axes of ``x1`` such that the contracted axes are last and the axes of ``x2`` such that the contracted axes are first (in both cases, in the order given by ``axes``), reshaping the permuted arrays into two-dimensional arrays having shapes ``(P, K)`` and ``(K, Q)``, respectively, computing their matrix product (see :func:`~array_api.matmul`), and reshaping the product to the output shape. Accordingly, a conforming implementation may compute ``tensordot`` by means of a single call to an optimized matrix multiplication routine (e.g., a BLAS ``gemm`` routine).
+
     .. versionchanged:: 2022.12
        Added complex data type support.
 
@@ -133,6 +140,9 @@ def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
 
     over the dimension specified by ``axis`` and where :math:`n` is the dimension size and :math:`\overline{a_i}` denotes the complex conjugate if :math:`a_i` is complex and the identity if :math:`a_i` is real-valued.
 
+    .. note::
+       Only the elements of ``x1`` are complex conjugated. Accordingly, for complex floating-point input arrays, ``vecdot(x1, x2)`` is the complex conjugate of ``vecdot(x2, x1)``, and the two results are not equal in general.
+
     Parameters
     ----------
     x1: array
@@ -149,13 +159,14 @@ def vecdot(x1: array, x2: array, /, *, axis: int = -1) -> array:
     Returns
     -------
     out: array
-        if ``x1`` and ``x2`` are both one-dimensional arrays, a zero-dimensional containing the dot product; otherwise, a non-zero-dimensional array containing the dot products and having rank ``N-1``, where ``N`` is the rank (number of dimensions) of the shape determined according to :ref:`broadcasting` along the non-contracted axes. The returned array must have a data type determined by :ref:`type-promotion`.
+        if ``x1`` and ``x2`` are both one-dimensional arrays, a zero-dimensional array containing the dot product; otherwise, a non-zero-dimensional array containing the dot products and having rank ``N-1``, where ``N`` is the rank (number of dimensions) of the shape determined according to :ref:`broadcasting` along the non-contracted axes. The returned array must have a data type determined by :ref:`type-promotion`.
 
     Notes
     -----
 
     **Raises**
 
+    -   if either ``x1`` or ``x2`` is a zero-dimensional array.
     -   if the size of the axis over which to compute the dot product is not the same (before broadcasting) for both ``x1`` and ``x2``.
 
     .. versionchanged:: 2022.12
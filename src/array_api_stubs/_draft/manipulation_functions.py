@@ -50,6 +50,9 @@ def broadcast_to(x: array, /, shape: Tuple[int, ...]) -> array:
     -------
     out: array
         an array having a specified shape. Must have the same data type as ``x``.
+
+        .. note::
+           A conforming implementation may return a view on ``x`` in which multiple elements refer to the same memory location (e.g., by using a stride of zero along broadcasted dimensions). Consequently, an array having a constant value and which is only read (e.g., ``broadcast_to(asarray(fill_value), shape)``) need not allocate memory for every element. Mutating the returned array is not portable (see :ref:`copyview-mutability`).
     """
 
 
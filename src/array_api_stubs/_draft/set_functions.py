@@ -40,7 +40,7 @@ def unique_all(x: array, /) -> Tuple[array, array, array, array]:
         - fourth element must have the field name ``counts`` and must be an array containing the number of times each unique element occurs in ``x``. The order of the returned counts must match the order of ``values``, such that a specific element in ``counts`` corresponds to the respective unique element in ``values``. The returned array must have same shape as ``values`` and must have the default array index data type.
 
         .. note::
-           The order of unique elements is not specified and may vary between implementations.
+           The order of unique elements is not specified and may vary between implementations. In particular, unique elements are not required to be sorted (e.g., an implementation may return unique elements in order of first occurrence or in an order determined by a hash table).
 
     Notes
     -----
@@ -85,7 +85,7 @@ def unique_counts(x: array, /) -> Tuple[array, array]:
         -   second element must have the field name `counts` and must be an array containing the number of times each unique element occurs in ``x``. The order of the returned counts must match the order of ``values``, such that a specific element in ``counts`` corresponds to the respective unique element in ``values``. The returned array must have same shape as ``values`` and must have the default array index data type.
 
         .. note::
-           The order of unique elements is not specified and may vary between implementations.
+           The order of unique elements is not specified and may vary between implementations. In particular, unique elements are not required to be sorted (e.g., an implementation may return unique elements in order of first occurrence or in an order determined by a hash table).
 
     Notes
     -----
@@ -130,7 +130,7 @@ def unique_inverse(x: array, /) -> Tuple[array, array]:
         -   second element must have the field name ``inverse_indices`` and must be an array containing the indices of ``values`` that reconstruct ``x``. The array must have the same shape as ``x`` and have the default array index data type.
 
         .. note::
-           The order of unique elements is not specified and may vary between implementations.
+           The order of unique elements is not specified and may vary between implementations. In particular, unique elements are not required to be sorted (e.g., an implementation may return unique elements in order of first occurrence or in an order determined by a hash table).
 
     Notes
     -----
@@ -170,7 +170,7 @@ def unique_values(x: array, /) -> array:
         a one-dimensional array containing the set of unique elements in ``x``. The returned array must have the same data type as ``x``.
 
         .. note::
-           The order of unique elements is not specified and may vary between implementations.
+           The order of unique elements is not specified and may vary between implementations. In particular, unique elements are not required to be sorted (e.g., an implementation may return unique elements in order of first occurrence or in an order determined by a hash table).
 
     Notes
     -----
@@ -18,11 +18,11 @@ def argsort(
     x : array
         input array. Should have a real-valued data type.
     axis: int
-        axis along which to sort. If set to ``-1``, the function must sort along the last axis. Default: ``-1``.
+        axis along which to sort. A valid ``axis`` must be an integer on the interval ``[-N, N)``, where ``N`` is the rank (number of dimensions) of ``x``. If an ``axis`` is specified as a negative integer, the function must determine the axis along which to sort by counting backward from the last dimension (where ``-1`` refers to the last dimension). If set to ``-1``, the function must sort along the last axis. Each one-dimensional slice of ``x`` along ``axis`` must be sorted independently of every other slice. Default: ``-1``.
     descending: bool
         sort order. If ``True``, the returned indices sort ``x`` in descending order (by value). If ``False``, the returned indices sort ``x`` in ascending order (by value). Default: ``False``.
     stable: bool
-        sort stability. If ``True``, the returned indices must maintain the relative order of ``x`` values which compare as equal. If ``False``, the returned indices may or may not maintain the relative order of ``x`` values which compare as equal (i.e., the relative order of ``x`` values which compare as equal is implementation-dependent). Default: ``True``.
+        sort stability. If ``True``, the returned indices must maintain the relative order of ``x`` values which compare as equal. This requirement also applies when ``descending`` is ``True``, such that a stable descending sort is not, in general, equivalent to reversing the result of a stable ascending sort. If ``False``, the returned indices may or may not maintain the relative order of ``x`` values which compare as equal (i.e., the relative order of ``x`` values which compare as equal is implementation-dependent). Default: ``True``.
 
     Returns
     -------
@@ -45,7 +45,7 @@ def sort(
     x: array
         input array. Should have a real-valued data type.
     axis: int
-        axis along which to sort. If set to ``-1``, the function must sort along the last axis. Default: ``-1``.
+        axis along which to sort. A valid ``axis`` must be an integer on the interval ``[-N, N)``, where ``N`` is the rank (number of dimensions) of ``x``. If an ``axis`` is specified as a negative integer, the function must determine the axis along which to sort by counting backward from the last dimension (where ``-1`` refers to the last dimension). If set to ``-1``, the function must sort along the last axis. Each one-dimensional slice of ``x`` along ``axis`` must be sorted independently of every other slice. Default: ``-1``.
     descending: bool
         sort order. If ``True``, the array must be sorted in descending order (by value). If ``False``, the array must be sorted in ascending order (by value). Default: ``False``.
     stable: bool